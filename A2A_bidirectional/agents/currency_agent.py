@@ -9,7 +9,7 @@ from A2A_bidirectional.utils.remote_client import HostAgent
 from A2A_bidirectional.core.react_agent_factory import build_react_agent
 from A2A_bidirectional.server.a2a_server import create_app, start_server
 from A2A_bidirectional.utils.remote_client import AgentCard, AgentCapabilities
-from A2A_bidirectional.utils.helpers import serve_and_register
+from A2A_bidirectional.utils.helpers import register_in_background, serve_and_register
 
 def _make_router_tools(host_agent: HostAgent, self_card: AgentCard):
     @tool
@@ -31,6 +31,7 @@ def _make_router_tools(host_agent: HostAgent, self_card: AgentCard):
 
 EXTRA_INSTRUCTIONS = """
 • If the question is a currency conversion, use convert().
+• If list_remote_agents() shows a specialist for the question, call it directly via send_task(agent_name, task_str).
 • Otherwise delegate to HostAgent via send_task("HostAgent", task_str).
 """
 
@@ -45,7 +46,7 @@ def chat(
         [], help="Peer URLs (typically just the HostAgent, e.g. http://localhost:8000)"
     ),
 ):
-    host_agent = HostAgent(peers)
+    host_agent = HostAgent(peers, fallback_agent="HostAgent")
     host_agent.initialize()
 
     card = AgentCard(
@@ -58,7 +59,8 @@ def chat(
     react_agent = build_react_agent(name, _make_router_tools(host_agent, card), host_agent, EXTRA_INSTRUCTIONS)
 
     app = create_app(react_agent, card)
-    serve_and_register(app, card, port, "http://localhost:8000")
+    host_url = peers[0] if peers else "http://localhost:8000"
+    serve_and_register(app, card, port, host_url, peers=host_agent)
 
 
     typer.echo(f"{name} ready. Type 'exit' to quit.")
@@ -86,7 +88,7 @@ def run(
     port: int = 8002,
     peers: list[str] = typer.Option([], help="Peer URLs"),
 ):
-    host_agent = HostAgent(peers)
+    host_agent = HostAgent(peers, fallback_agent="HostAgent")
     host_agent.initialize()
 
     card = AgentCard(
@@ -98,6 +100,10 @@ def run(
 
     react_agent = build_react_agent(name, _make_router_tools(host_agent, card), host_agent, EXTRA_INSTRUCTIONS)
 
+    # register (and keep the peer list fresh) once the server is up,
+    # so send_task() can route directly
+    host_url = peers[0] if peers else "http://localhost:8000"
+    register_in_background(card, port, host_url, peers=host_agent)
     start_server(create_app(react_agent, card), port)
 
 
@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import asyncio
+import time
 import uuid
+from collections import OrderedDict
 from uuid import uuid4
 from typing import Any, Dict
 
@@ -26,10 +28,89 @@ async def _call_agent(agent, user_msg: str, thread_id: str | None = None) -> str
     )
 
 
-def create_app(agent, agent_card: AgentCard) -> FastAPI:
-    """Expects an invokeable agent and an agent card as inputs."""
+class _TaskEntry:
+    """One task id: the request that created it plus its execution / output."""
+
+    def __init__(self, text: str, session_id: str | None, task: asyncio.Task) -> None:
+        self.finished: float | None = None  # completion time, drives the TTL
+        self.text = text
+        self.session_id = session_id
+        self.task: asyncio.Task | None = task  # dropped once finished
+        self.output: str | None = None
+
+    def matches(self, text: str, session_id: str | None) -> bool:
+        return self.text == text and self.session_id == session_id
+
+
+class _TaskStore:
+    """
+    Per‑task‑id record of running executions and their final outputs.
+
+    Finished tasks are evicted *ttl* seconds after they completed, or
+    oldest first once there are more than *max_tasks* entries. Running
+    tasks are never evicted, so the store may exceed *max_tasks* while
+    they are in flight.
+    Failed tasks are dropped as soon as they finish, so a retry recomputes.
+    Only touched from the server's event loop, so no locking is needed.
+    """
+
+    def __init__(self, max_tasks: int = 1000, ttl: float = 3600.0) -> None:
+        self.max_tasks = max_tasks
+        self.ttl = ttl
+        self._entries: OrderedDict[str, _TaskEntry] = OrderedDict()
+
+    def _purge(self) -> None:
+        cutoff = time.monotonic() - self.ttl
+        # finished entries are kept in completion order (see _on_done)
+        for task_id, entry in list(self._entries.items()):
+            if entry.finished is None:
+                continue
+            if entry.finished >= cutoff and len(self._entries) <= self.max_tasks:
+                break
+            del self._entries[task_id]
+
+    def get(self, task_id: str) -> _TaskEntry | None:
+        self._purge()
+        return self._entries.get(task_id)
+
+    def start(self, task_id: str, text: str, session_id: str | None, coro) -> _TaskEntry:
+        """Run *coro* as the execution of *task_id* and record it."""
+        task = asyncio.ensure_future(coro)
+        entry = self._entries[task_id] = _TaskEntry(text, session_id, task)
+        task.add_done_callback(lambda t: self._on_done(task_id, t))
+        self._purge()
+        return entry
+
+    def _on_done(self, task_id: str, task: asyncio.Task) -> None:
+        # retrieve the exception even if nobody awaits the task any more
+        failed = task.cancelled() or task.exception() is not None
+        entry = self._entries.get(task_id)
+        if entry is None or entry.task is not task:
+            return
+        if failed:
+            del self._entries[task_id]
+        else:
+            entry.output = str(task.result())
+            entry.task = None
+            entry.finished = time.monotonic()
+            self._entries.move_to_end(task_id)
+
+
+def create_app(
+    agent,
+    agent_card: AgentCard,
+    max_tasks: int = 1000,
+    task_ttl: float = 3600.0,
+) -> FastAPI:
+    """Expects an invokeable agent and an agent card as inputs.
+
+    Repeated `tasks/send` calls with the same task id attach to the running
+    execution or replay its stored result (see *max_tasks* / *task_ttl*).
+    Reusing a task id with a different message or session is rejected (409).
+    """
     
     app = FastAPI(title=agent_card.name)
+    task_store = _TaskStore(max_tasks, task_ttl)
 
     @app.get("/.well-known/agent.json")
     async def agent_card_endpoint():  # noqa: D401
@@ -50,13 +131,28 @@ def create_app(agent, agent_card: AgentCard) -> FastAPI:
         session_id = params.get("sessionId") or str(uuid.uuid4())
         _ = session_id  # left here in case you want session memories
 
-        reply = await _call_agent(agent, text, session_id)
+        task_id = params["id"]
+        entry = task_store.get(task_id)
+        if entry is None:
+            entry = task_store.start(
+                task_id, text, params.get("sessionId"), _call_agent(agent, text, session_id)
+            )
+        elif not entry.matches(text, params.get("sessionId")):
+            raise HTTPException(
+                status_code=409, detail="Task id already used for a different message"
+            )
+
+        if entry.output is not None:
+            output = entry.output
+        else:
+            # shield: a dropped client must not cancel the shared execution
+            output = str(await asyncio.shield(entry.task))
 
         # Normalise reply → we always send COMPLETED for demo
         result = {
-            "id": params["id"],
+            "id": task_id,
             "status": {"state": TaskState.COMPLETED},
-            "output": str(reply),
+            "output": output,
         }
         return JSONResponse({"jsonrpc": "2.0", "result": result, "id": body["id"]})
 
@@ -1,18 +1,69 @@
+from __future__ import annotations
+
 from fastapi import FastAPI
-import threading, time
+import socket, threading, time
+
+import requests
 
-from A2A_bidirectional.utils.remote_client import AgentCard
+from A2A_bidirectional.utils.remote_client import AgentCard, HostAgent
 from A2A_bidirectional.server.a2a_server import create_app, start_server
 
 # utils/helpers.py (or directly in each chat() function)
 
-def serve_and_register(app, card, port, host_url):
+def _wait_for_port(port: int, tries: int = 30) -> bool:
+    """Poll localhost:*port* every 0.1 s until it accepts connections."""
+    for _ in range(tries):
+        with socket.socket() as s:
+            if s.connect_ex(("127.0.0.1", port)) == 0:
+                return True
+        time.sleep(0.1)
+    return False
+
+
+def _register(card: AgentCard, host_url: str, peers: HostAgent | None = None) -> bool:
+    """POST /register to the host and seed *peers* from the `knownPeers` reply."""
+    try:
+        resp = requests.post(f"{host_url.rstrip('/')}/register",
+                             json=card.model_dump(), timeout=5)
+        resp.raise_for_status()
+    except requests.RequestException as exc:
+        print(f"⚠️  could not register with HostAgent: {exc}")
+        return False
+
+    if peers is not None:
+        try:
+            peers.sync_peers(resp.json().get("knownPeers", []), exclude=card.name)
+        except Exception as exc:  # noqa: BLE001
+            print(f"⚠️  could not read knownPeers: {exc}")
+    return True
+
+
+def _keep_registered(card: AgentCard, host_url: str, peers: HostAgent | None,
+                     refresh_interval: float) -> None:
+    """
+    Re‑POST /register every *refresh_interval* seconds. This keeps *peers*
+    fresh and re‑announces the agent after a HostAgent restart, which would
+    otherwise come back with an empty registry.
+    """
+    while True:
+        time.sleep(refresh_interval)
+        try:
+            _register(card, host_url, peers)
+        except Exception as exc:  # noqa: BLE001 – keep the thread alive
+            print(f"⚠️  could not refresh registration: {exc}")
+
+
+def serve_and_register(app, card, port, host_url, peers: HostAgent | None = None,
+                       refresh_interval: float = 30.0):
     """
     1. spin up the FastAPI server in a daemon thread
     2. wait until the socket is open
     3. POST /register to the host
+    4. if *peers* is given: seed it from `knownPeers` and keep it fresh by
+       re‑registering every *refresh_interval* seconds, so send_task()
+       can reach other specialists directly instead of via the host
     """
-    import socket, threading, time, requests, uvicorn
+    import uvicorn
 
     # 1) start uvicorn in the background
     def _run():
@@ -20,19 +71,31 @@ def serve_and_register(app, card, port, host_url):
 
     threading.Thread(target=_run, daemon=True).start()
 
-    # 2) wait for the port to open (max ~3 s)
-    for _ in range(30):
-        with socket.socket() as s:
-            if s.connect_ex(("127.0.0.1", port)) == 0:
-                break
-        time.sleep(0.1)
-    else:
+    # 2) wait for the port to open (max ~3 s)
+    if not _wait_for_port(port):
         print(f"⚠️  server on :{port} never came up"); return
 
-    # 3) now it is safe to register
-    try:
-        requests.post(f"{host_url}/register",
-                      json=card.model_dump(), timeout=5)
+    # 3) + 4) now it is safe to register
+    if _register(card, host_url, peers):
         print("✅ auto‑registered with HostAgent")
-    except requests.RequestException as exc:
-        print(f"⚠️  could not register automatically: {exc}")
+    if peers is not None:
+        threading.Thread(target=_keep_registered,
+                         args=(card, host_url, peers, refresh_interval),
+                         daemon=True).start()
+
+
+def register_in_background(card, port, host_url, peers: HostAgent | None = None,
+                           refresh_interval: float = 30.0):
+    """
+    Like steps 2–4 of serve_and_register(), but in a daemon thread, for
+    agents that run the server in the foreground via start_server().
+    """
+    def _run():
+        if not _wait_for_port(port, tries=100):
+            print(f"⚠️  server on :{port} never came up – not registering"); return
+        if _register(card, host_url, peers):
+            print("✅ auto‑registered with HostAgent")
+        if peers is not None:
+            _keep_registered(card, host_url, peers, refresh_interval)
+
+    threading.Thread(target=_run, daemon=True).start()
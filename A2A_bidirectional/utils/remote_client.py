@@ -126,10 +126,19 @@ class HostAgent:
         • a client (for making JSON‑RPC calls)
         • a registry (for other agents to register themselves)
     """
-    def __init__(self, peer_urls: List[str] | None = None):
+    def __init__(
+        self,
+        peer_urls: List[str] | None = None,
+        fallback_agent: str | None = None,
+    ):
         self._clients: Dict[str, RemoteAgentClient] = {}
         self._registry: Dict[str, AgentCard] = {}
+        # name → client, rebuilt from the host's peer list by sync_peers()
+        self._synced: Dict[str, RemoteAgentClient] = {}
         self._lock = threading.Lock()
+        # Peer that handles tasks for names we cannot reach directly
+        # (typically "HostAgent" on specialist agents).
+        self.fallback_agent = fallback_agent
         for url in peer_urls or []:
             self._add_client(url)
  
@@ -154,6 +163,34 @@ class HostAgent:
             self._registry[card.name] = card
             self._add_client(card.url)
 
+    def sync_peers(self, cards: list[dict], exclude: str | None = None) -> None:
+        """
+        Replace the synced peers with *cards* (e.g. `knownPeers` from
+        /register or GET /peers), which is treated as the full set: peers
+        no longer listed are dropped. Clients from `peer_urls` are kept.
+        Cards are taken as‑is, so no agent.json round trip is made per peer.
+        """
+        if not isinstance(cards, list):
+            print(f"[WARN] Ignoring malformed peer list: {cards!r}")
+            return
+
+        synced: Dict[str, RemoteAgentClient] = {}
+        for data in cards:
+            try:
+                card = AgentCard(**data)
+            except Exception as exc:  # noqa: BLE001
+                print(f"[WARN] Skipping malformed AgentCard {data!r}: {exc}")
+                continue
+            if card.name == exclude:
+                continue
+            old = self._synced.get(card.name)
+            client = old if old and old.base_url == card.url.rstrip("/") else RemoteAgentClient(card.url)
+            client.agent_card = card
+            synced[card.name] = client
+
+        with self._lock:
+            self._synced = synced
+
     def list_agents(self) -> list[dict]:
         return [c.model_dump() for c in self._registry.values()]
 
@@ -167,7 +204,11 @@ class HostAgent:
 
     def list_agents_info(self) -> list[dict]:
         infos = []
-        for c in self._clients.values():
+        with self._lock:
+            clients = list(self._clients.values())
+            urls = {c.base_url for c in clients}
+            clients += [c for c in self._synced.values() if c.base_url not in urls]
+        for c in clients:
             card = c.agent_card
             infos.append(
                 {
@@ -179,17 +220,42 @@ class HostAgent:
             )
         return infos
 
-    def send_task(self, agent_name: str, message: str) -> str:
-        for c in self._clients.values():
+    def _find_client(self, agent_name: str) -> Optional[RemoteAgentClient]:
+        with self._lock:
+            if agent_name in self._synced:
+                return self._synced[agent_name]
+            clients = list(self._clients.values())
+        for c in clients:
             if c.agent_card and c.agent_card.name == agent_name:
-                task_id = str(uuid.uuid4())
-                session_id = "session‑p2p"
-                try:
-                    result = c.send_task(task_id, session_id, message)
-                    state = (
-                        result.get("status", {}).get("state") or TaskState.UNKNOWN
-                    )
-                    return f"state={state}, result={result}"
-                except Exception as exc:  # noqa: BLE001
-                    return f"Error while calling peer: {exc}"
-        return f"No peer named '{agent_name}'."
\ No newline at end of file
+                return c
+        return None
+
+    def send_task(self, agent_name: str, message: str) -> str:
+        """
+        Route *message* straight to *agent_name*. If that peer is unknown or
+        unreachable, hand the task to `fallback_agent` (if configured). Other
+        errors (timeouts, HTTP errors) are returned as‑is: the peer may
+        already be working on the task, so re‑running it elsewhere would
+        only add load.
+        """
+        error = f"No peer named '{agent_name}'."
+        client = self._find_client(agent_name)
+        if client is not None:
+            task_id = str(uuid.uuid4())
+            session_id = "session‑p2p"
+            try:
+                result = client.send_task(task_id, session_id, message)
+                state = (
+                    result.get("status", {}).get("state") or TaskState.UNKNOWN
+                )
+                return f"state={state}, result={result}"
+            except requests.ConnectionError as exc:
+                error = f"Error while calling peer: {exc}"
+            except Exception as exc:  # noqa: BLE001
+                return f"Error while calling peer: {exc}"
+
+        fallback = self.fallback_agent
+        if fallback and fallback != agent_name and self._find_client(fallback):
+            # mark it, so the caller can tell the host answered, not the peer
+            return f"via {fallback} (fallback): {self.send_task(fallback, message)}"
+        return error
\ No newline at end of file
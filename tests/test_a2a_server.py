@@ -0,0 +1,127 @@
+"""Tests for the idempotent task store behind the A2A JSON‑RPC server."""
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")  # needed by TestClient
+
+from fastapi.testclient import TestClient
+
+from A2A_bidirectional.server import a2a_server
+from A2A_bidirectional.server.a2a_server import _TaskStore, create_app
+from A2A_bidirectional.utils.remote_client import AgentCard
+
+
+async def _work(result):
+    await asyncio.sleep(0)
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+async def _wait_for(gate: asyncio.Future):
+    return await gate
+
+
+class _Clock:
+    """Stand‑in for the `time` module inside a2a_server."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def test_attach_and_replay():
+    async def main():
+        store = _TaskStore()
+        entry = store.start("t1", "hi", "s1", _work("ok"))
+        # a second request while running attaches to the same execution
+        assert store.get("t1") is entry
+        # the store's done callback runs before this await resumes
+        await entry.task
+        assert entry.output == "ok" and entry.task is None
+        assert store.get("t1").output == "ok"
+
+    asyncio.run(main())
+
+
+def test_failure_is_not_cached_without_awaiters():
+    async def main():
+        store = _TaskStore()
+        entry = store.start("t1", "hi", None, _work(RuntimeError("boom")))
+        await asyncio.wait({entry.task})  # nobody retrieves the result
+        assert store.get("t1") is None
+
+    asyncio.run(main())
+
+
+def test_ttl_and_size_eviction_skip_running_tasks():
+    async def main():
+        clock = _Clock()
+        with mock.patch.object(a2a_server, "time", clock):
+            store = _TaskStore(max_tasks=2, ttl=10)
+            gate = asyncio.get_running_loop().create_future()
+            running = store.start("slow", "a", None, _wait_for(gate))
+            for task_id in "bc":
+                await store.start(task_id, task_id, None, _work(task_id)).task
+            await store.start("d", "d", None, _work("d")).task
+
+            # over the limit: finished ones go oldest first, the running one stays
+            assert store.get("slow") is running
+            assert store.get("b") is None and store.get("c") is None
+            assert store.get("d").output == "d"
+
+            # the TTL counts from completion, not from the start
+            clock.now += 9
+            gate.set_result("x")
+            await running.task
+            clock.now += 6
+            assert store.get("d") is None
+            assert store.get("slow").output == "x"
+            clock.now += 5
+            assert store.get("slow") is None
+
+    asyncio.run(main())
+
+
+class _CountingAgent:
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, inputs, config):
+        self.calls += 1
+        return f"reply #{self.calls}"
+
+
+def _payload(task_id: str, text: str, session_id: str = "s1") -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": str(time.monotonic()),
+        "method": "tasks/send",
+        "params": {
+            "id": task_id,
+            "sessionId": session_id,
+            "message": {"role": "user", "parts": [{"type": "text", "text": text}]},
+        },
+    }
+
+
+def test_json_rpc_replays_result_for_same_task_id():
+    agent = _CountingAgent()
+    client = TestClient(create_app(agent, AgentCard(name="Test", url="http://test")))
+
+    first = client.post("/", json=_payload("t1", "hello")).json()["result"]
+    again = client.post("/", json=_payload("t1", "hello")).json()["result"]
+    assert first["output"] == again["output"] == "reply #1"
+    assert agent.calls == 1
+
+    resp = client.post("/", json=_payload("t1", "something else"))
+    assert resp.status_code == 409
+    assert agent.calls == 1
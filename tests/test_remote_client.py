@@ -0,0 +1,158 @@
+"""Tests for HostAgent peer syncing and direct / fallback routing."""
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+import requests
+
+from A2A_bidirectional.utils.remote_client import HostAgent
+
+HOST_URL = "http://host:8000"
+
+
+def _card(name: str, url: str) -> dict:
+    return {
+        "name": name,
+        "url": url,
+        "version": "0.1.0",
+        "description": f"{name} for tests",
+        "capabilities": {"streaming": False},
+    }
+
+
+def _response(data: dict) -> mock.Mock:
+    resp = mock.Mock()
+    resp.json.return_value = data
+    resp.raise_for_status.return_value = None
+    return resp
+
+
+def _reply(output: str) -> mock.Mock:
+    return _response({"result": {"status": {"state": "completed"}, "output": output}})
+
+
+@pytest.fixture
+def agent() -> HostAgent:
+    """A specialist's HostAgent: the host from --peers plus the fallback."""
+    with mock.patch("requests.get", return_value=_response(_card("HostAgent", HOST_URL))):
+        return HostAgent([HOST_URL], fallback_agent="HostAgent")
+
+
+def _names(agent: HostAgent) -> set[str]:
+    return {info["name"] for info in agent.list_agents_info()}
+
+
+# --------------------------------------------------------------------------
+# sync_peers
+# --------------------------------------------------------------------------
+def test_sync_skips_self_and_malformed_cards(agent):
+    agent.sync_peers(
+        [_card("CurrencyAgent", "http://c:1"), {"bogus": 1}, "nope", _card("Me", "http://me:1")],
+        exclude="Me",
+    )
+    assert _names(agent) == {"HostAgent", "CurrencyAgent"}
+
+
+def test_sync_ignores_malformed_list(agent):
+    agent.sync_peers([_card("CurrencyAgent", "http://c:1")])
+    agent.sync_peers({"knownPeers": []})
+    assert agent._find_client("CurrencyAgent") is not None
+
+
+def test_sync_reuses_client_for_unchanged_url(agent):
+    agent.sync_peers([_card("CurrencyAgent", "http://c:1")])
+    client = agent._find_client("CurrencyAgent")
+
+    agent.sync_peers([_card("CurrencyAgent", "http://c:1/")])
+    assert agent._find_client("CurrencyAgent") is client
+
+    agent.sync_peers([_card("CurrencyAgent", "http://c:2")])
+    assert agent._find_client("CurrencyAgent").base_url == "http://c:2"
+
+
+def test_sync_drops_departed_peers_but_keeps_cli_peers(agent):
+    agent.sync_peers([_card("CurrencyAgent", "http://c:1"), _card("DatabaseAgent", "http://d:1")])
+    agent.sync_peers([_card("DatabaseAgent", "http://d:1")])
+    assert agent._find_client("CurrencyAgent") is None
+    assert _names(agent) == {"HostAgent", "DatabaseAgent"}
+
+
+# --------------------------------------------------------------------------
+# send_task routing
+# --------------------------------------------------------------------------
+def test_direct_hit(agent):
+    agent.sync_peers([_card("CurrencyAgent", "http://c:1")])
+    with mock.patch("requests.post", return_value=_reply("11 USD")) as post:
+        out = agent.send_task("CurrencyAgent", "convert 10 EUR")
+    assert post.call_args.args[0] == "http://c:1"
+    assert out.startswith("state=completed") and "11 USD" in out
+
+
+def test_connection_error_falls_back_to_host(agent):
+    agent.sync_peers([_card("CurrencyAgent", "http://c:1")])
+    side_effect = [requests.ConnectionError("refused"), _reply("from host")]
+    with mock.patch("requests.post", side_effect=side_effect) as post:
+        out = agent.send_task("CurrencyAgent", "convert 10 EUR")
+    assert [c.args[0] for c in post.call_args_list] == ["http://c:1", HOST_URL]
+    assert out.startswith("via HostAgent (fallback): state=completed")
+
+
+def test_unknown_peer_falls_back_to_host(agent):
+    with mock.patch("requests.post", return_value=_reply("from host")) as post:
+        out = agent.send_task("CurrencyAgent", "convert 10 EUR")
+    assert post.call_args.args[0] == HOST_URL
+    assert out.startswith("via HostAgent (fallback):")
+
+
+@pytest.mark.parametrize(
+    "exc", [requests.ReadTimeout("slow"), requests.HTTPError("500 Server Error")]
+)
+def test_other_errors_do_not_fall_back(agent, exc):
+    agent.sync_peers([_card("CurrencyAgent", "http://c:1")])
+    with mock.patch("requests.post", side_effect=exc) as post:
+        out = agent.send_task("CurrencyAgent", "convert 10 EUR")
+    assert post.call_count == 1
+    assert out == f"Error while calling peer: {exc}"
+
+
+def test_no_recursion_when_fallback_is_target(agent):
+    with mock.patch("requests.post", side_effect=requests.ConnectionError("down")) as post:
+        out = agent.send_task("HostAgent", "hello")
+    assert post.call_count == 1
+    assert out == "Error while calling peer: down"
+
+
+def test_unresolvable_fallback_keeps_original_error():
+    agent = HostAgent(fallback_agent="HostAgent")
+    agent.sync_peers([_card("CurrencyAgent", "http://c:1")])
+    with mock.patch("requests.post", side_effect=requests.ConnectionError("refused")):
+        assert agent.send_task("CurrencyAgent", "x") == "Error while calling peer: refused"
+    assert agent.send_task("DatabaseAgent", "x") == "No peer named 'DatabaseAgent'."
+
+
+# --------------------------------------------------------------------------
+# helpers: registration seeds the peer list
+# --------------------------------------------------------------------------
+def test_register_seeds_peers_from_known_peers():
+    pytest.importorskip("fastapi")
+    from A2A_bidirectional.utils.helpers import _register
+    from A2A_bidirectional.utils.remote_client import AgentCard
+
+    me = AgentCard(name="Me", url="http://me:1")
+    agent = HostAgent()
+    known = {"knownPeers": [_card("Me", "http://me:1"), _card("CurrencyAgent", "http://c:1")]}
+    with mock.patch("requests.post", return_value=_response(known)) as post:
+        assert _register(me, HOST_URL + "/", agent)
+    assert post.call_args.args[0] == f"{HOST_URL}/register"
+    assert _names(agent) == {"CurrencyAgent"}
+
+    # an unreadable reply neither raises nor wipes the peers
+    bad = _response({})
+    bad.json.side_effect = ValueError("not json")
+    with mock.patch("requests.post", return_value=bad):
+        assert _register(me, HOST_URL, agent)
+    assert _names(agent) == {"CurrencyAgent"}
+
+    with mock.patch("requests.post", side_effect=requests.ConnectionError("down")):
+        assert not _register(me, HOST_URL, agent)